@@ -3,6 +3,14 @@ import torch.nn as nn
 from .model import Model
 from ..problem.spaces import Points
 
+
+class _CubedReLU(nn.Module):
+    # relu(x)**3 with native torch operations, the activation of the
+    # original paper
+    def forward(self, x):
+        return torch.relu(x)**3
+
+
 class DeepRitzNet(Model):
     """
     Implementation of the architecture used in the Deep Ritz paper [1].
@@ -18,16 +26,24 @@ class DeepRitzNet(Model):
         The width of the used hidden fully connected layers.
     depth : int
         The amount of subsequent residual blocks.
+    activations : torch.nn, optional
+        The activation function that is applied after each fully connected
+        layer inside the residual blocks.
+        Default is relu(x)**3, as in the original paper.
 
     Notes
     -----
     ..  [1] Weinan E and Bing Yu, "The Deep Ritz method: A deep learning-based numerical
         algorithm for solving variational problems", 2017
     """
-    def __init__(self, input_space, output_space, width, depth):
+    def __init__(self, input_space, output_space, width, depth,
+                 activations=None):
         super().__init__(input_space, output_space)
         self.width = width
         self.depth = depth
+        if activations is None:
+            activations = _CubedReLU()
+        self.activations = activations
         self.linearIn = nn.Linear(self.input_space.dim, self.width)
         self.linear1 = nn.ModuleList()
         self.linear2 = nn.ModuleList()
@@ -39,10 +55,12 @@ class DeepRitzNet(Model):
 
     def forward(self, x):
         x = self._fix_points_order(x)
+        return Points(self.forward_tensor(x.as_tensor), self.output_space)
+
+    def forward_tensor(self, x):
         x = self.linearIn(x) # Match input dimension of network
         for (layer1,layer2) in zip(self.linear1, self.linear2):
-            x_temp = torch.relu(layer1(x)**3)
-            x_temp = torch.relu(layer2(x_temp)**3)
+            x_temp = self.activations(layer1(x))
+            x_temp = self.activations(layer2(x_temp))
             x = x_temp + x
-        
-        return Points(self.linearOut(x), self.output_space)
\ No newline at end of file
+        return self.linearOut(x)
\ No newline at end of file
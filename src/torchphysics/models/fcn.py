@@ -1,7 +1,14 @@
+import copy
+import itertools
+import time
+import warnings
+
+import numpy as np
 import torch
 import torch.nn as nn
 
 from .model import Model
+from .activation_fn import Sinus
 from ..problem.spaces import Points
 
 
@@ -26,6 +33,36 @@ def _construct_FC_layers(hidden, input_dim, output_dim, activations, xavier_gain
     return layers
 
 
+_NUMPY_ACTIVATIONS = {
+    nn.Tanh: np.tanh,
+    nn.ReLU: lambda x: np.maximum(x, 0),
+    nn.Sigmoid: lambda x: 1 / (1 + np.exp(-x)),
+    nn.Identity: lambda x: x,
+    Sinus: np.sin
+}
+
+
+# maximal number of entries of the first layer output, that FCN keeps as a
+# buffer for evaluations in inference mode
+_MAX_BUFFER_NUMEL = 2**16
+
+
+class _TransposedLinear(nn.Module):
+    """Inference version of a nn.Linear layer, that stores the transposed
+    weight matrix in contiguous memory. Used in :meth:`FCN.to_inference`.
+    """
+    def __init__(self, linear):
+        super().__init__()
+        self.weight_t = nn.Parameter(linear.weight.detach().t().contiguous(),
+                                     requires_grad=False)
+        self.bias = nn.Parameter(linear.bias.detach().clone(), requires_grad=False)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        if x.dim() == 2:
+            return torch.addmm(self.bias, x, self.weight_t)
+        return torch.matmul(x, self.weight_t) + self.bias
+
+
 class FCN(Model):
     """A simple fully connected neural network.
 
@@ -50,21 +87,392 @@ class FCN(Model):
         For the weight initialization a Xavier/Glorot algorithm will be used.
         The gain can be specified over this value.
         Default is 5/3. 
+    mixed_precision : bool, optional
+        If True, the layers are evaluated under torch.autocast with bfloat16,
+        which roughly doubles the throughput of the matrix products on
+        supported hardware (e.g. Ampere GPUs or newer). The weights stay in
+        float32 and the output is cast back to the dtype of the input.
+        Since the reduced precision also affects the derivatives of the
+        network, this should be used with care for PINNs.
+        Default is False.
+    compile : bool, optional
+        If True, the layers are additionally compiled with torch.compile
+        (needs PyTorch 2.0 or newer), which fuses the linear layers and
+        activations into fewer kernels. Since compiled graphs do not support
+        higher order derivatives, the compiled version is only used if
+        gradients are disabled, e.g. in validation steps, plots or inside
+        ``torch.no_grad()``. The first evaluation triggers the compilation and
+        is therefore slow. The compilation is done with dynamic shapes, such
+        that different batch sizes do not lead to recompilations. The compiled
+        function is not part of the state of the model, it is created again
+        after copying or unpickling the model.
+        Default is False.
+
+    Notes
+    -----
+    For the small widths that are common for PINNs, the matrix products of
+    the hidden layers do only a few operations per loaded byte and are
+    therefore limited by the memory bandwidth, especially for small batches.
+    In this regime, larger batches (see :meth:`forward_many`) or a reduced
+    precision (``mixed_precision``) help the most. Use :meth:`regime` to
+    estimate in which regime a network works for a given batch size.
+
+    Inside ``torch.inference_mode()``, the output of the first layer is
+    written into a buffer that is kept and reused by the next evaluation with
+    the same batch size. Only outputs with at most 65536 entries (e.g. 2048
+    points for a width of 32) are kept. Larger evaluations, like plots on
+    fine grids, allocate their memory as usual, so it is freed afterwards.
+    The buffer is not part of the copied or pickled state.
     """
     def __init__(self,
                  input_space,
                  output_space,
                  hidden=(20,20,20),
                  activations=nn.Tanh(),
-                 xavier_gains=5/3):
+                 xavier_gains=5/3,
+                 mixed_precision=False,
+                 compile=False):
         super().__init__(input_space, output_space)
+        self.mixed_precision = mixed_precision
+        self._compiled_sequential = None
+        self._hidden_buffer = None
+        self._cuda_graph = None
 
         layers = _construct_FC_layers(hidden=hidden, input_dim=self.input_space.dim, 
                                       output_dim=self.output_space.dim, 
                                       activations=activations, xavier_gains=xavier_gains)
 
         self.sequential = nn.Sequential(*layers)
+        self.optimized_mode = 'compile' if compile else 'eager'
+
+    def __getstate__(self):
+        # compiled functions and CUDA graphs can neither be copied nor
+        # pickled, compiled functions are created again on the next evaluation
+        # without gradients, CUDA graphs have to be captured again
+        state = self.__dict__.copy()
+        state['_compiled_sequential'] = None
+        state['_hidden_buffer'] = None
+        state['_cuda_graph'] = None
+        return state
+
+    def _compiled_layers(self):
+        if self._compiled_sequential is None:
+            # compile only the method, to keep the parameters registered once
+            self._compiled_sequential = torch.compile(self.sequential.forward,
+                                                      dynamic=True)
+        return self._compiled_sequential
 
     def forward(self, points):
         points = self._fix_points_order(points)
-        return Points(self.sequential(points), self.output_space)
+        return Points(self.forward_tensor(points.as_tensor), self.output_space)
+
+    def forward_tensor(self, x):
+        if self.mixed_precision:
+            with torch.autocast(device_type=x.device.type, dtype=torch.bfloat16):
+                out = self._apply_layers(x)
+            return out.to(x.dtype)
+        return self._apply_layers(x)
+
+    def _apply_layers(self, x):
+        if self.optimized_mode == 'compile' and not torch.is_grad_enabled():
+            return self._compiled_layers()(x)
+        if torch.is_inference_mode_enabled() and not self.mixed_precision \
+                and len(x.shape) == 2:
+            return self._apply_layers_with_buffer(x)
+        return self.sequential(x)
+
+    def _apply_layers_with_buffer(self, x):
+        # Only used in inference mode, where no autograd graph references the
+        # output of the first layer. Therefore it can be written into a buffer,
+        # that is reused as long as the batch size does not change. Large
+        # buffers are not kept, to not hold their memory after the evaluation.
+        first_layer = self.sequential[0]
+        shape = (x.shape[0], first_layer.out_features)
+        buffer = self._hidden_buffer
+        if buffer is None or buffer.shape != shape or buffer.device != x.device \
+                or buffer.dtype != x.dtype:
+            buffer = torch.empty(shape, device=x.device, dtype=x.dtype)
+            if buffer.numel() <= _MAX_BUFFER_NUMEL:
+                self._hidden_buffer = buffer
+            else:
+                self._hidden_buffer = None
+        x = torch.addmm(first_layer.bias, x, first_layer.weight.t(), out=buffer)
+        for layer in itertools.islice(self.sequential, 1, None):
+            x = layer(x)
+        return x
+
+    def capture_cuda_graph(self, example_points, warmup_steps=3):
+        """Records the evaluation of this network as a CUDA graph, such that
+        all layers can later be executed with a single launch, see
+        :meth:`replay_cuda_graph`. Meant for repeated evaluations with a fixed
+        number of points, e.g. on a fixed grid after the training.
+
+        Parameters
+        ----------
+        example_points : torchphysics.spaces.Points
+            Points of the shape that will be used in all following replays.
+            Have to lay on a CUDA device.
+        warmup_steps : int, optional
+            The number of evaluations before the recording, needed to
+            initialize the CUDA libraries. Default is 3.
+
+        Notes
+        -----
+        The graph is recorded without gradients and reads the parameter
+        memory at every replay, so in-place updates of the weights (e.g. by an
+        optimizer) are used. It has to be captured again, if the shape of the
+        input changes or if the parameter tensors are replaced, e.g. by
+        ``.to()``, ``.half()`` or ``load_state_dict(..., assign=True)``.
+        Otherwise the replay still uses the old parameters. The graph is not
+        part of the copied or pickled state.
+        """
+        if not example_points.as_tensor.is_cuda:
+            raise ValueError("CUDA graphs can only be captured for points on a "
+                             "CUDA device.")
+        example_points = self._fix_points_order(example_points)
+        static_input = example_points.as_tensor.detach().clone()
+        with torch.no_grad():
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(stream):
+                for _ in range(warmup_steps):
+                    self.forward_tensor(static_input)
+            torch.cuda.current_stream().wait_stream(stream)
+            graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(graph):
+                static_output = self.forward_tensor(static_input)
+        self._cuda_graph = (graph, static_input, static_output)
+
+    def replay_cuda_graph(self, points):
+        """Evaluates the network with the CUDA graph recorded in
+        :meth:`capture_cuda_graph`.
+
+        Parameters
+        ----------
+        points : torchphysics.spaces.Points
+            The input points, have to be of the same shape, dtype and device
+            as the points used for the recording. Otherwise a ValueError is
+            raised.
+
+        Returns
+        -------
+        torchphysics.spaces.Points
+            The output of the network. The data is copied out of the graph,
+            so it is not overwritten by later replays.
+        """
+        if self._cuda_graph is None:
+            raise RuntimeError("No CUDA graph recorded, call capture_cuda_graph first.")
+        graph, static_input, static_output = self._cuda_graph
+        points = self._fix_points_order(points)
+        x = points.as_tensor
+        # copy_ would broadcast smaller inputs silently
+        if x.shape != static_input.shape or x.dtype != static_input.dtype \
+                or x.device != static_input.device:
+            raise ValueError(f"The CUDA graph was recorded for inputs of shape "
+                             f"{tuple(static_input.shape)}, dtype {static_input.dtype} "
+                             f"on {static_input.device}, but got shape "
+                             f"{tuple(x.shape)}, dtype {x.dtype} on {x.device}.")
+        static_input.copy_(x)
+        graph.replay()
+        return Points(static_output.clone(), self.output_space)
+
+    def export_numpy(self):
+        """Creates a NumPy version of this network. For very small batches on
+        the CPU (e.g. single points in post-processing), the evaluation with
+        NumPy avoids the overhead of PyTorch and is much faster.
+
+        Returns
+        -------
+        callable
+            A function that evaluates the network for a np.array of the shape
+            (..., input_space.dimension) and returns a np.array.
+
+        Notes
+        -----
+        The current weights are copied, later changes of this network will not
+        be transfered. Only the activations torch.nn.Tanh, torch.nn.ReLU,
+        torch.nn.Sigmoid, torch.nn.Identity and torchphysics.models.Sinus are
+        supported, other activations raise a ValueError.
+        """
+        layers = []
+        for layer in self.sequential:
+            if isinstance(layer, nn.Linear):
+                weight_t = layer.weight.detach().cpu().numpy().T.copy()
+                bias = layer.bias.detach().cpu().numpy().copy()
+                layers.append((weight_t, bias))
+            elif type(layer) in _NUMPY_ACTIVATIONS:
+                layers.append(_NUMPY_ACTIVATIONS[type(layer)])
+            else:
+                supported = ', '.join(act.__name__ for act in _NUMPY_ACTIVATIONS)
+                raise ValueError(f"Activation {layer} has no NumPy version, "
+                                 f"supported are: {supported}.")
+
+        def numpy_fcn(x):
+            for layer in layers:
+                if isinstance(layer, tuple):
+                    x = x @ layer[0] + layer[1]
+                else:
+                    x = layer(x)
+            return x
+        return numpy_fcn
+
+    def optimize(self, example_points, modes=('eager', 'script+freeze', 'compile'),
+                 n=100):
+        """Measures which implementation of the layers is the fastest for
+        evaluations without gradients.
+
+        Parameters
+        ----------
+        example_points : torchphysics.spaces.Points
+            Points that are typical for the later evaluations.
+        modes : tuple, optional
+            The implementations that should be compared:
+
+                - 'eager': The normal PyTorch evaluation.
+                - 'script+freeze': The frozen TorchScript module of
+                  :meth:`to_inference`.
+                - 'compile': The layers compiled with torch.compile.
+
+            Default are all three.
+        n : int, optional
+            The number of evaluations for the time measurement of each mode.
+            Default is 100.
+
+        Returns
+        -------
+        str
+            The fastest mode.
+        callable
+            The implementation of the fastest mode. Works on tensors of the
+            shape (..., input_space.dimension), like :meth:`forward_tensor`.
+            For 'eager' and 'compile' this is :meth:`forward_tensor` itself.
+
+        Notes
+        -----
+        Only 'eager' and 'compile' read the current parameters of the network.
+        They are measured through :meth:`forward_tensor` in inference mode, so
+        mixed precision and the inference buffer are included. The faster of
+        these two is saved in ``optimized_mode`` and used from then on in all
+        evaluations of this network without gradients.
+        'script+freeze' works on a copy of the current weights, therefore it
+        is only returned, e.g. for plots or error computations after the
+        training, and never used inside this network.
+        Modes that fail for this network, e.g. 'script+freeze' for activations
+        that TorchScript does not support, are skipped with a warning. If all
+        modes fail, a RuntimeError is raised from the last error.
+        """
+        for mode in modes:
+            if mode not in ('eager', 'script+freeze', 'compile'):
+                raise ValueError(f"Unknown mode {mode}, use one of 'eager', "
+                                 "'script+freeze' and 'compile'.")
+        x = self._fix_points_order(example_points).as_tensor.detach()
+        candidates = {}
+        timings = {}
+        last_error = None
+        previous_mode = self.optimized_mode
+        with torch.inference_mode():
+            for mode in modes:
+                try:
+                    layers = self._create_layers_for_mode(mode)
+                    # first calls include the compilation or graph optimization
+                    for _ in range(3):
+                        layers(x)
+                except Exception as err:
+                    if mode == 'compile':
+                        self._compiled_sequential = None
+                    warnings.warn(f"Mode {mode} is skipped, since it failed for "
+                                  f"this network: {err!r}")
+                    last_error = err
+                    continue
+                candidates[mode] = layers
+                timings[mode] = self._measure_layers(layers, x, n)
+        self.optimized_mode = previous_mode
+        if len(timings) == 0:
+            raise RuntimeError(f"None of the modes {modes} works for this "
+                               "network.") from last_error
+        live_modes = [mode for mode in timings if mode in ('eager', 'compile')]
+        if len(live_modes) > 0:
+            self.optimized_mode = min(live_modes, key=timings.get)
+        fastest_mode = min(timings, key=timings.get)
+        return fastest_mode, candidates[fastest_mode]
+
+    def _create_layers_for_mode(self, mode):
+        if mode == 'script+freeze':
+            return self.to_inference()
+        # the live modes are measured through forward_tensor, such that
+        # mixed precision and the inference buffer are included
+        self.optimized_mode = mode
+        return self.forward_tensor
+
+    @staticmethod
+    def _measure_layers(layers, x, n):
+        if x.is_cuda:
+            torch.cuda.synchronize()
+        start = time.perf_counter()
+        for _ in range(n):
+            layers(x)
+        if x.is_cuda:
+            torch.cuda.synchronize()
+        return time.perf_counter() - start
+
+    def regime(self, batch_size, machine_balance=10.0):
+        """Estimates whether the evaluation of this network is limited by the
+        memory bandwidth or by the compute power of the hardware.
+
+        Parameters
+        ----------
+        batch_size : int
+            The number of points that are evaluated in one forward pass.
+        machine_balance : float, optional
+            The number of floating point operations the hardware can do per
+            loaded byte. Around 10 for CPUs, GPUs are often higher.
+            Default is 10.
+
+        Returns
+        -------
+        str
+            'memory' if the arithmetic intensity (operations per byte of the
+            weights, inputs and outputs of all linear layers) is smaller than
+            the machine balance, otherwise 'compute'.
+        """
+        flops, n_bytes = 0, 0
+        for layer in self.sequential:
+            if isinstance(layer, nn.Linear):
+                weight_size = layer.in_features * layer.out_features
+                flops += 2 * batch_size * weight_size
+                n_bytes += 4 * (weight_size + batch_size * (layer.in_features
+                                                            + layer.out_features))
+        if flops / n_bytes < machine_balance:
+            return 'memory'
+        return 'compute'
+
+    def to_inference(self):
+        """Creates a frozen TorchScript version of this network, that can be used
+        for fast evaluations after the training, e.g. for plots or error
+        computations.
+
+        Returns
+        -------
+        torch.jit.ScriptModule
+            The frozen network. Works on tensors of the shape
+            (..., input_space.dimension), like :meth:`forward_tensor`.
+
+        Notes
+        -----
+        The parameters are copied into the returned module as constants, where
+        the weight matrices are stored transposed, such that the matrix
+        products read them row by row. Therefore, the module can not be
+        trained further and later changes of this network will not be
+        transfered. The first calls of the returned module are slow, since
+        TorchScript optimizes the graph for the given input shapes. If the
+        input shape changes in every call, the evaluation inside
+        ``with torch.jit.optimized_execution(False):`` may be faster.
+        """
+        layers = []
+        for layer in self.sequential:
+            if isinstance(layer, nn.Linear):
+                layers.append(_TransposedLinear(layer))
+            else:
+                layers.append(copy.deepcopy(layer))
+        sequential = nn.Sequential(*layers).eval()
+        return torch.jit.freeze(torch.jit.script(sequential))
@@ -27,6 +27,54 @@ class Model(nn.Module):
             points = points[..., list(self.input_space.keys())]
         return points
 
+    def forward_tensor(self, x):
+        """Evaluates the model for a plain tensor, instead of a Points-object.
+
+        Parameters
+        ----------
+        x : torch.tensor
+            The input data of shape (batch_length, input_space.dimension), where
+            the variables have the same order as in the input space. Like the
+            data of Points, the tensor should be batch-first, with the
+            coordinates in the last (contiguous) axis.
+
+        Returns
+        -------
+        torch.tensor
+            The output of the model, in the order of the output space.
+
+        Notes
+        -----
+        Models that work on tensors internally overwrite this method, such that
+        the wrapping of the data into Points is skipped completely.
+        """
+        return self(Points(x, self.input_space)).as_tensor
+
+    def forward_many(self, points_list):
+        """Evaluates the model for multiple sets of points with a single forward
+        pass. The points are concatenated along the first batch-dimension, such
+        that each layer computes one large matrix product instead of many
+        small ones.
+
+        Parameters
+        ----------
+        points_list : list or tuple
+            The Points at which the model should be evaluated, e.g. the points
+            of different parts of the boundary. All have to lay in the
+            input space of the model.
+
+        Returns
+        -------
+        list
+            The output Points of the model, one for each input Points in the
+            same order.
+        """
+        points_list = [self._fix_points_order(points) for points in points_list]
+        lengths = [points.as_tensor.shape[0] for points in points_list]
+        inp = torch.cat([points.as_tensor for points in points_list], dim=0)
+        out = self(Points(inp, self.input_space))
+        return [Points(o, out.space) for o in torch.split(out.as_tensor, lengths)]
+
 
 class NormalizationLayer(Model):
     """
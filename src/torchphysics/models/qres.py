@@ -107,4 +107,8 @@ class QRES(Model):
         self.sequential = nn.Sequential(*layers)
 
     def forward(self, points):
-        return Points(self.sequential(points), self.output_space)
\ No newline at end of file
+        points = self._fix_points_order(points)
+        return Points(self.forward_tensor(points.as_tensor), self.output_space)
+
+    def forward_tensor(self, x):
+        return self.sequential(x)
\ No newline at end of file
@@ -27,6 +27,15 @@ class SquaredError(torch.nn.Module):
         return torch.sum(torch.square(x), dim=1)
 
 
+def _track_coord_gradients_if_enabled(points):
+    """Counterpart of Points.track_coord_gradients, for conditions that only
+    track input gradients during training, i.e. when autograd is enabled.
+    """
+    if torch.is_grad_enabled():
+        return points.track_coord_gradients()
+    return points.coordinates, points
+
+
 class Condition(torch.nn.Module):
     """
     A general condition which should be optimized or tracked.
@@ -50,6 +59,20 @@ class Condition(torch.nn.Module):
         self.weight = weight
         self.track_gradients = track_gradients
 
+    @property
+    def track_gradients(self):
+        return self._track_gradients
+
+    @track_gradients.setter
+    def track_gradients(self, value):
+        # bind the preparation of the input points once, so that the
+        # forward pass does not have to check the setting in every step
+        self._track_gradients = value
+        if value is False:
+            self._track_coord_gradients = _track_coord_gradients_if_enabled
+        else:
+            self._track_coord_gradients = Points.track_coord_gradients
+
     @abc.abstractmethod
     def forward(self, device='cpu', iteration=None):
         """
@@ -234,7 +257,7 @@ class SingleModuleCondition(Condition):
         else:
             x = self.sampler.sample_points(device=device)
 
-        x_coordinates, x = x.track_coord_gradients()
+        x_coordinates, x = self._track_coord_gradients(x)
 
         data = {}
         for fun in self.data_functions:
@@ -481,9 +504,9 @@ class PeriodicCondition(Condition):
         x_left = self.left_sampler.sample_points(device=device)
         x_right = self.right_sampler.sample_points(device=device)
 
-        x_left_coordinates, x_left = x_left.track_coord_gradients()
-        x_right_coordinates, x_right = x_right.track_coord_gradients()
-        x_b_coordinates, x_b = x_b.track_coord_gradients()
+        x_left_coordinates, x_left = self._track_coord_gradients(x_left)
+        x_right_coordinates, x_right = self._track_coord_gradients(x_right)
+        x_b_coordinates, x_b = self._track_coord_gradients(x_b)
 
 
         data_left = {}
@@ -611,8 +634,8 @@ class IntegroPINNCondition(Condition):
 
         x = x.unsqueeze(dim=1)
         x_int = x_int.unsqueeze(dim=0)
-        x_coordinates, x = x.track_coord_gradients()
-        x_int_coordinates, x_int = x_int.track_coord_gradients()
+        x_coordinates, x = self._track_coord_gradients(x)
+        x_int_coordinates, x_int = self._track_coord_gradients(x_int)
 
         # combine both inputs to be able to compute model(x_int) with all correct
         # parameters
@@ -42,7 +42,7 @@ class DeepONetSingleModuleCondition(Condition):
         else:
             x = self.input_sampler.sample_points(device=device)
         x = x.unsqueeze(0).repeat(len(self.function_set), 1, 1)
-        x_coordinates, x = x.track_coord_gradients()
+        x_coordinates, x = self._track_coord_gradients(x)
 
         # 3) evaluate model (only trunk net)
         y = self.net(x, device=device)
@@ -31,12 +31,14 @@ class Interval(Domain):
                         upper_bound=new_upper_bound)
 
     def _contains(self, points, params=Points.empty()):
-        lb = self.lower_bound(points.join(params))
-        ub = self.upper_bound(points.join(params))
-        points = points[:, list(self.space.keys())].as_tensor
-        bigger_then_low = torch.ge(points[:, None], lb) 
-        smaller_then_up = torch.le(points[:, None], ub) 
-        return torch.logical_and(bigger_then_low, smaller_then_up).reshape(-1, 1)
+        points_and_params = points.join(params)
+        lb = self.lower_bound(points_and_params)
+        ub = self.upper_bound(points_and_params)
+        points = points[:, list(self.space.keys())].as_tensor[:, None]
+        # combine both bounds into one mask, without a third tensor
+        inside = torch.ge(points, lb)
+        inside &= torch.le(points, ub)
+        return inside.reshape(-1, 1)
 
     def sample_random_uniform(self, n=None, d=None, params=Points.empty(),
                               device='cpu'):
@@ -99,8 +101,9 @@ class IntervalBoundary(BoundaryDomain):
         return torch.logical_or(close_to_left, close_to_right).reshape(-1, 1)
 
     def _check_close_left_right(self, points, params):
-        lb = self.domain.lower_bound(points.join(params))
-        ub = self.domain.upper_bound(points.join(params))
+        points_and_params = points.join(params)
+        lb = self.domain.lower_bound(points_and_params)
+        ub = self.domain.upper_bound(points_and_params)
         points = points[:, list(self.space.keys())].as_tensor
         close_to_left = torch.isclose(points[:, None], lb)
         close_to_right = torch.isclose(points[:, None], ub)
@@ -269,22 +269,14 @@ class ShapelyBoundary(BoundaryDomain):
     def _compute_normals(self, outline):
         face_number = sum([len(corners) for corners in outline])
         normal_list = torch.zeros((face_number, 2))
-        index = 0
-        for corners in outline:
-            for i in range(len(corners)-1):
-                normal = self._compute_local_normal_vector(corners[i+1], corners[i])
-                normal_list[index] = normal
-                index += 1
+        # all sides of all boundary parts at once, in the same order as in
+        # _where_on_boundary
+        sides = torch.cat([corners[1:] - corners[:-1] for corners in outline])
+        side_length = torch.linalg.norm(sides, dim=1, keepdim=True)
+        normals = torch.column_stack((sides[:, 1], -sides[:, 0])) / side_length
+        normal_list[:len(sides)] = normals
         return normal_list
 
-    def _compute_local_normal_vector(self, end_corner, start_corner):
-        conect_vector = end_corner - start_corner
-        side_length = torch.linalg.norm(conect_vector, dim=0)
-        normal = torch.index_select(conect_vector, 0, torch.LongTensor([1, 0]))
-        normal /= side_length
-        normal[1] *= -1
-        return normal
-
     def _where_on_boundary(self, points, outline):
         index = -1 * torch.ones(len(points), dtype=int)
         counter = 0
@@ -94,7 +94,7 @@ class Sphere(Domain):
     def _point_grid_in_box(self, n, radius, device):
         scaled_n = int(np.ceil(np.cbrt(n*6/np.pi)))
         axis = torch.linspace(-radius, radius, scaled_n, device=device)
-        points = torch.stack(torch.meshgrid(axis, axis, axis)).T
+        points = torch.stack(torch.meshgrid(axis, axis, axis, indexing='ij'), dim=-1)
         return points.reshape(-1, 3)
 
     def _get_points_inside(self, points, radius):
@@ -188,7 +188,8 @@ class TrimeshPolyhedron(Domain):
         x_axis = torch.linspace(bounds[0], bounds[1], scaled_n, device=device)
         y_axis = torch.linspace(bounds[2], bounds[3], scaled_n, device=device)
         z_axis = torch.linspace(bounds[4], bounds[5], scaled_n, device=device)
-        points = torch.stack(torch.meshgrid(x_axis, y_axis, z_axis)).mT
+        points = torch.stack(torch.meshgrid(x_axis, y_axis, z_axis, indexing='ij'),
+                             dim=-1)
         return points.reshape(-1, 3)
 
     def _get_bounding_box_volume(self, bounds):
@@ -243,8 +244,6 @@ class TrimeshBoundary(BoundaryDomain):
             self._transform_input_for_normals(points, params, device)
         points = points.as_tensor.detach().cpu()
         index = self.domain.mesh.nearest.on_surface(points)[2]
-        mesh_normals = torch.tensor(self.domain.mesh.face_normals, device=device)
-        normals = torch.zeros((len(points), 3), device=device)
-        for i in range(len(points)):
-            normals[i, :] = mesh_normals[index[i]]
-        return normals
\ No newline at end of file
+        # gather in numpy and convert once, instead of copying all face normals
+        normals = self.domain.mesh.face_normals[index]
+        return torch.as_tensor(normals, dtype=torch.float32, device=device)
\ No newline at end of file
@@ -97,10 +97,15 @@ class FunctionSet():
         """
         n_points = len(points)
         n_params = len(self.param_batch)
-        points_repeated = points.as_tensor.unsqueeze(0).repeat(n_params,1,1)
-        params_repeated = self.param_batch.as_tensor.unsqueeze(1).repeat(1,n_points,1)
-        param_point_meshgrid = Points(torch.cat((params_repeated, points_repeated), dim=-1),
-                                      self.param_batch.space*points.space)
+        params_tensor = self.param_batch.as_tensor
+        points_tensor = points.as_tensor
+        # allocate the meshgrid once and fill both blocks by broadcasting
+        dtype = torch.promote_types(params_tensor.dtype, points_tensor.dtype)
+        meshgrid = torch.empty((n_params, n_points, self.param_batch.dim + points.dim),
+                               dtype=dtype, device=params_tensor.device)
+        meshgrid[..., :self.param_batch.dim] = params_tensor.unsqueeze(1)
+        meshgrid[..., self.param_batch.dim:] = points_tensor.unsqueeze(0)
+        param_point_meshgrid = Points(meshgrid, self.param_batch.space*points.space)
         return param_point_meshgrid
 
     @abc.abstractmethod
@@ -107,9 +107,9 @@ class GaussianSampler(PointSampler):
 
     def _check_mean_correct_dim(self):
         if isinstance(self.mean, numbers.Number):
-            self.mean = torch.FloatTensor([self.mean])
+            self.mean = torch.tensor([self.mean], dtype=torch.float32)
         elif not isinstance(self.mean, torch.Tensor):
-            self.mean = torch.FloatTensor(self.mean)
+            self.mean = torch.tensor(self.mean, dtype=torch.float32)
         assert len(self.mean) == self.domain.dim, \
             f"""Dimension of mean: {self.mean}, does not fit the domain.""" 
 
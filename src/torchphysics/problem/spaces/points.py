@@ -25,6 +25,12 @@ class Points():
     dictionary. So all data points can be stored as a single tensor, where
     we efficently can access and transform the data. But at the same time
     have the knowledge of what points belong to which space/variable.
+
+    The data is stored batch-first: all leading axes are batch-dimensions and
+    the last axis contains the coordinates of the variables, one block after
+    another in the order of the space. Since the last axis is contiguous in
+    memory, the tensor can be passed directly to linear layers (a single
+    matrix product per layer), without any reordering.
     """
 
     def __init__(self, data, space, **kwargs):
@@ -118,9 +124,10 @@ class Points():
         variable, e.g. {'x': torch.Tensor, 't': torch.Tensor}
         """
         out = {}
-        variable_slice = self._variable_slices
-        for var in self.space:
-            out[var] = self._t[..., variable_slice[var]]
+        start = 0
+        for var, dim in self.space.items():
+            out[var] = self._t[..., start:start+dim]
+            start += dim
         return out
 
     @property
@@ -370,7 +377,23 @@ class Points():
         return self
     
     def track_coord_gradients(self):
+        """Enables the tracking of gradients w.r.t. each variable of the points.
+
+        Returns
+        -------
+        dict
+            The coordinates of each variable, which now require gradients.
+        Points
+            A points object that is build from these coordinates, such that
+            derivatives w.r.t. the single variables can be computed.
+        """
         points_coordinates = self.coordinates
+        if len(points_coordinates) == 0:
+            return points_coordinates, Points.empty()
         for var in points_coordinates:
-            points_coordinates[var].requires_grad = True
-        return points_coordinates, Points.from_coordinates(points_coordinates)
+            points_coordinates[var].requires_grad_(True)
+        if len(points_coordinates) == 1:
+            # the single variable already covers the whole tensor, no copy needed
+            return points_coordinates, Points(points_coordinates[var], self.space)
+        coords_tensor = torch.cat(tuple(points_coordinates.values()), dim=-1)
+        return points_coordinates, Points(coords_tensor, self.space)
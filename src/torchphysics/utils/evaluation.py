@@ -5,7 +5,6 @@ import time
 import torch
 
 from .user_fun import UserFunction
-from ..problem.spaces import Points
 
 
 def compute_min_and_max(model, sampler, evaluation_fn=lambda u:u, 
@@ -24,8 +23,9 @@ def compute_min_and_max(model, sampler, evaluation_fn=lambda u:u,
         desiered output quantity.
     device : str or torch device
         The device of the model.    
-    track_gradients : bool
-        Whether to track input gradients or not. 
+    requieres_grad : bool
+        Whether to track input gradients or not. If False, the evaluation
+        runs in torch.inference_mode.
 
     Returns
     -------
@@ -36,19 +36,23 @@ def compute_min_and_max(model, sampler, evaluation_fn=lambda u:u,
     '''
     print('-- Start evaluation of minimum and maximum --')
     input_points = next(sampler)
-    input_points._t.requires_grad = requieres_grad
     input_points._t.to(device)
-    # eval. model
-    inp_points_dict = input_points.coordinates
-    start_model_eval = time.time()
-    model_out = model(Points.from_coordinates(inp_points_dict))
-    end_model_eval = time.time()
-    # eval user function
-    evaluation_fn = UserFunction(evaluation_fn)
-    data_dict = {**model_out.coordinates, **inp_points_dict}
-    start_func_eval = time.time()
-    prediction = evaluation_fn(data_dict) 
-    end_func_eval = time.time()
+    # the sampled points are not changed, gradients are tracked on new tensors
+    if requieres_grad:
+        inp_points_dict, input_points = input_points.track_coord_gradients()
+    else:
+        inp_points_dict = input_points.coordinates
+    # without input gradients, no autograd graph has to be recorded at all
+    with torch.inference_mode(not requieres_grad):
+        start_model_eval = time.time()
+        model_out = model(input_points)
+        end_model_eval = time.time()
+        # eval user function
+        evaluation_fn = UserFunction(evaluation_fn)
+        data_dict = {**model_out.coordinates, **inp_points_dict}
+        start_func_eval = time.time()
+        prediction = evaluation_fn(data_dict) 
+        end_func_eval = time.time()
     max_pred = torch.max(prediction)
     min_pred = torch.min(prediction)
     print('Time to evaluate model:', end_model_eval - start_model_eval)
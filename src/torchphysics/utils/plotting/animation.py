@@ -9,7 +9,8 @@ import numpy as np
 import torch
 
 from .plot_functions import (_compute_output_shape, _create_info_text, 
-                             _create_figure_and_axis, _triangulation_of_domain)
+                             _create_figure_and_axis, _triangulation_of_domain,
+                             _evaluate_model)
 from ...problem.spaces import Points
 from ..user_fun import UserFunction
 
@@ -97,8 +98,7 @@ def _construct_points_and_evaluate_model(animation_points, domain_points,
 
 
 def _evaluate_animation_function(model, ani_function, inp_point):
-    model_out = model(Points.from_coordinates(inp_point))
-    data_dict = {**model_out.coordinates, **inp_point}
+    data_dict = {**_evaluate_model(model, inp_point), **inp_point}
     output = ani_function(data_dict)
     if isinstance(output, torch.Tensor):
         output = output.detach().cpu().numpy()
@@ -153,9 +153,7 @@ def _create_plot_output(model, plot_function, point_sampler, device):
     # first create the plot points and evaluate the model
     inp_points = point_sampler.sample_points(device=device)
     inp_points_dict = inp_points.coordinates
-    model_out = model(Points.from_coordinates(inp_points_dict))
-    data_dict = {**model_out.coordinates, **inp_points_dict}
-    # When model output correct: data_dict = {**model_out.coordinates, **inp_points.coordinates}
+    data_dict = {**_evaluate_model(model, inp_points_dict), **inp_points_dict}
     # now evaluate the plot function
     output = plot_function(data_dict)
     if isinstance(output, torch.Tensor):
@@ -165,10 +163,19 @@ def _create_plot_output(model, plot_function, point_sampler, device):
     return inp_points, output, out_shape
 
 
+def _evaluate_model(model, inp_points_dict):
+    # the input tensor is created directly in the order of the input space,
+    # instead of building Points that the model would have to reorder
+    inp = torch.cat([inp_points_dict[var] for var in model.input_space], dim=-1)
+    return Points(model.forward_tensor(inp), model.output_space).coordinates
+
+
 def _compute_output_shape(output):
     out_shape = 1
-    if len(np.shape(output)) > 1:
-        out_shape = np.shape(output)[1]     
+    # arrays know their shape, only other outputs (lists, scalars) need np.shape
+    shape = output.shape if isinstance(output, np.ndarray) else np.shape(output)
+    if len(shape) > 1:
+        out_shape = shape[1]
     return out_shape
 
 
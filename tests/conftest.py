@@ -7,4 +7,13 @@
     - https://docs.pytest.org/en/stable/writing_plugins.html
 """
 
-# import pytest
+import pytest
+import numpy as np
+import torch
+
+
+@pytest.fixture(autouse=True)
+def _seed_random_generators():
+    # samplers draw from torch, trimesh from the global numpy generator
+    np.random.seed(0)
+    torch.manual_seed(0)
@@ -6,7 +6,7 @@ from torchphysics.problem.conditions import *
 from torchphysics.problem.spaces import Points, R1, R2
 from torchphysics.problem.domains import Interval
 from torchphysics.problem.samplers import GridSampler, DataSampler
-from torchphysics.utils import UserFunction, laplacian, PointsDataLoader
+from torchphysics.utils import UserFunction, grad, laplacian, PointsDataLoader
 from torchphysics.models import Parameter
 
 
@@ -14,6 +14,16 @@ def helper_fn(x, D=0.0):
     return Points(x**2 + D, R1('u'))
 
 
+@pytest.fixture(scope='module')
+def x_interval():
+    return Interval(R1('x'), 0, 1)
+
+
+@pytest.fixture(scope='module')
+def helper_module():
+    return UserFunction(helper_fn)
+
+
 def test_create_general_condition():
     cond = Condition(name='test', weight=2.0, track_gradients=False)
     assert cond.name == 'test'
@@ -33,9 +43,45 @@ def test_track_gradients():
     assert 't' in point_dict.keys()
 
 
-def test_setup_data_functions():
+def test_track_gradients_can_be_disabled():
+    cond = Condition(track_gradients=False)
+    p = Points(torch.tensor([[2, 3.0, 0.0], [1, 1, 1]]), R1('t')*R2('x'))
+    with torch.no_grad():
+        point_dict, new_points = cond._track_coord_gradients(p)
+    assert new_points is p
+    assert not point_dict['x'].requires_grad
+    # during training the gradients are still tracked
+    point_dict, new_points = cond._track_coord_gradients(p)
+    assert point_dict['x'].requires_grad
+    cond.track_gradients = True
+    point_dict, new_points = cond._track_coord_gradients(p)
+    assert point_dict['x'].requires_grad
+
+
+def test_pinncondition_forward_without_gradient_tracking(x_interval, helper_module):
+    ps = GridSampler(x_interval, n_points=25)
+    cond = PINNCondition(module=helper_module, sampler=ps, residual_fn=lambda u: u,
+                         track_gradients=False)
+    with torch.no_grad():
+        out = cond()
+    assert isinstance(out, torch.Tensor)
+    assert not out.requires_grad
+
+
+def test_pinncondition_derivatives_without_gradient_tracking_in_training(
+        x_interval, helper_module):
+    ps = GridSampler(x_interval, n_points=25)
+    cond = PINNCondition(module=helper_module, sampler=ps,
+                         residual_fn=lambda u, x: grad(u, x),
+                         track_gradients=False)
+    out = cond()
+    expected = torch.mean(4*ps.sample_points().as_tensor**2)
+    assert torch.allclose(out, expected)
+
+
+def test_setup_data_functions(x_interval):
     cond = Condition()
-    ps = GridSampler(Interval(R1('x'), 0, 1), n_points=20)
+    ps = GridSampler(x_interval, n_points=20)
     data_fn = {'f1': lambda x: x, 'f2': UserFunction(lambda x: 2*x)}
     changed_data_fn = cond._setup_data_functions(data_fn, ps)
     assert isinstance(changed_data_fn, dict)
@@ -43,9 +89,9 @@ def test_setup_data_functions():
     assert isinstance(changed_data_fn['f1'], UserFunction)
 
 
-def test_setup_data_functions_with_static_sampler():
+def test_setup_data_functions_with_static_sampler(x_interval):
     cond = Condition()
-    ps = GridSampler(Interval(R1('x'), 0, 1), n_points=20).make_static()
+    ps = GridSampler(x_interval, n_points=20).make_static()
     data_fn = {'f1': lambda x: x}
     changed_data_fn = cond._setup_data_functions(data_fn, ps)
     assert isinstance(changed_data_fn, dict)
@@ -53,94 +99,94 @@ def test_setup_data_functions_with_static_sampler():
     assert torch.equal(changed_data_fn['f1'](), ps.sample_points())
 
 
-def test_periodiccondition():
-    module = UserFunction(helper_fn)
-    interval = Interval(R1('x'), 0, 1)
+@pytest.mark.parametrize('inference', [True, False])
+def test_periodiccondition(x_interval, helper_module, inference):
     sampler = GridSampler(Interval(R1('y'), 0, 1), n_points=10).make_static()
-    cond = PeriodicCondition(module,
-                             interval,
+    cond = PeriodicCondition(helper_module,
+                             x_interval,
                              lambda u_left, u_right: u_left-u_right,
                              non_periodic_sampler=sampler
                              )
     assert isinstance(cond, torch.nn.Module)
     assert cond.name == 'periodiccondition'
-    assert cond.module == module
-    out = cond()
+    assert cond.module is helper_module
+    with torch.inference_mode(inference):
+        out = cond()
     assert out == 1.0
 
 
-def test_periodiccondition_data_fun_empty_sampler():
+@pytest.mark.parametrize('inference', [True, False])
+def test_periodiccondition_data_fun_empty_sampler(x_interval, helper_module,
+                                                  inference):
     def data_fun(x):
         return x**2
-    module = UserFunction(helper_fn)
-    interval = Interval(R1('x'), 0, 1)
-    cond = PeriodicCondition(module,
-                             interval,
+    cond = PeriodicCondition(helper_module,
+                             x_interval,
                              lambda u_right, d_right: d_right-u_right,
                              data_functions={'d': data_fun}
                              )
-    out = cond()
+    with torch.inference_mode(inference):
+        out = cond()
     assert out == 0.0
 
 
-def test_create_datacondition():
-    module = UserFunction(helper_fn)
+def test_create_datacondition(helper_module):
     loader = PointsDataLoader((Points(torch.tensor([[0.0], [2.0]]), R1('x')),
                                Points(torch.tensor([[0.0], [4.0]]), R1('u'))),
                               batch_size=1)
-    cond = DataCondition(module=module, dataloader=loader, norm=2)
+    cond = DataCondition(module=helper_module, dataloader=loader, norm=2)
     assert isinstance(cond, torch.nn.Module)
     assert cond.name == 'datacondition'
-    assert cond.module == module
+    assert cond.module is helper_module
     assert next(iter(cond.dataloader))[0] == Points(torch.tensor([[0.0]]), R1('x'))
 
 
-def test_datacondition_forward():
-    module = UserFunction(helper_fn)
-    loader = PointsDataLoader((Points(torch.tensor([[0.0], [2.0]]), R1('x')),
-                               Points(torch.tensor([[0.0], [4.0]]), R1('u'))),
-                              batch_size=1)
-    cond = DataCondition(module=module, dataloader=loader, norm=2)
-    out = cond()
-    assert out == 0.0
-
-
-def test_datacondition_forward_2():
-    module = UserFunction(helper_fn)
+@pytest.mark.parametrize('u_data, use_full_dataset, expected',
+                         [([[0.0], [4.0]], False, 0.0),
+                          ([[0.0], [1.0]], True, 4.5)])
+@pytest.mark.parametrize('inference', [True, False])
+def test_datacondition_forward(helper_module, u_data, use_full_dataset, expected,
+                               inference):
     loader = PointsDataLoader((Points(torch.tensor([[0.0], [2.0]]), R1('x')),
-                               Points(torch.tensor([[0.0], [1.0]]), R1('u'))),
+                               Points(torch.tensor(u_data), R1('u'))),
                               batch_size=1)
-    cond = DataCondition(module=module, dataloader=loader,
-                         norm=2, use_full_dataset=True)
-    out = cond()
-    assert out == 4.5
+    cond = DataCondition(module=helper_module, dataloader=loader,
+                         norm=2, use_full_dataset=use_full_dataset)
+    with torch.inference_mode(inference):
+        out = cond()
+    assert out == expected
 
 
-def test_create_pinncondition():
-    module = UserFunction(helper_fn)
-    ps = GridSampler(Interval(R1('x'), 0, 1), n_points=25)
-    cond = PINNCondition(module=module, sampler=ps, residual_fn=lambda u: u)
+def test_create_pinncondition(x_interval, helper_module):
+    ps = GridSampler(x_interval, n_points=25)
+    cond = PINNCondition(module=helper_module, sampler=ps, residual_fn=lambda u: u)
     assert isinstance(cond, torch.nn.Module)
     assert cond.name == 'pinncondition'
-    assert cond.module == module
-    assert cond.sampler == ps
+    assert cond.module is helper_module
+    assert cond.sampler is ps
     assert isinstance(cond.residual_fn, UserFunction)
 
 
-def test_pinncondition_forward():
-    module = UserFunction(helper_fn)
-    ps = GridSampler(Interval(R1('x'), 0, 1), n_points=25)
-    cond = PINNCondition(module=module, sampler=ps, residual_fn=lambda u: u)
+@pytest.mark.parametrize('residual_fn, data_functions',
+                         [(lambda u: u, {}),
+                          (lambda u, x: laplacian(u, x), {}),
+                          (lambda f, u: f+u, {'f': lambda x: x})],
+                         ids=['identity', 'derivative', 'data_function'])
+def test_pinncondition_forward(x_interval, helper_module, residual_fn, data_functions):
+    ps = GridSampler(x_interval, n_points=25)
+    cond = PINNCondition(module=helper_module, sampler=ps, residual_fn=residual_fn,
+                         data_functions=data_functions)
     out = cond()
     assert isinstance(out, torch.Tensor)
     assert out.requires_grad
+    assert out.shape == torch.Size([])
 
 
-def test_pinncondition_forward_with_2D_output():
+def test_pinncondition_forward_with_2D_output(x_interval):
     def module_fn(x):
         return Points(torch.column_stack((x, x+1)), R2('u'))
     module = UserFunction(module_fn)
-    ps = GridSampler(Interval(R1('x'), 0, 1), n_points=25)
+    ps = GridSampler(x_interval, n_points=25)
     cond = PINNCondition(module=module, sampler=ps, residual_fn=lambda u: u)
     out = cond()
     assert isinstance(out, torch.Tensor)
@@ -148,75 +194,47 @@ def test_pinncondition_forward_with_2D_output():
     assert out.shape == torch.Size([])
 
 
-def test_pinncondition_forward_with_derivative():
-    def res_fn(u, x):
-        return laplacian(u, x)
-    module = UserFunction(helper_fn)
-    ps = GridSampler(Interval(R1('x'), 0, 1), n_points=10)
-    cond = PINNCondition(module=module, sampler=ps, residual_fn=res_fn)
-    out = cond()
-    assert isinstance(out, torch.Tensor)
-    assert out.requires_grad
-    assert out.shape == torch.Size([])
-
-
-def test_pinncondition_forward_with_parameter():
-    module = UserFunction(helper_fn)
+def test_pinncondition_forward_with_parameter(x_interval, helper_module):
     param = Parameter(init=2.0, space=R1('D'))
-    ps = GridSampler(Interval(R1('x'), 0, 1), n_points=25)
-    cond = PINNCondition(module=module, sampler=ps, residual_fn=lambda u: u,
+    ps = GridSampler(x_interval, n_points=25)
+    cond = PINNCondition(module=helper_module, sampler=ps, residual_fn=lambda u: u,
                          parameter=param)
     out = cond()
-    assert cond.parameter == param
-    assert isinstance(out, torch.Tensor)
-    assert out.requires_grad
-
-
-def test_pinncondition_forward_with_data_function():
-    module = UserFunction(helper_fn)
-    ps = GridSampler(Interval(R1('x'), 0, 1), n_points=25)
-    data_fn = {'f': lambda x: x}
-    cond = PINNCondition(module=module, sampler=ps, residual_fn=lambda f, u: f+u,
-                         data_functions=data_fn)
-    out = cond()
+    assert cond.parameter is param
     assert isinstance(out, torch.Tensor)
     assert out.requires_grad
 
 
-def test_create_ritzcondition():
-    module = UserFunction(helper_fn)
-    ps = GridSampler(Interval(R1('x'), 0, 1), n_points=25)
-    cond = DeepRitzCondition(module=module, sampler=ps, integrand_fn=lambda u: u)
+def test_create_ritzcondition(x_interval, helper_module):
+    ps = GridSampler(x_interval, n_points=25)
+    cond = DeepRitzCondition(module=helper_module, sampler=ps, integrand_fn=lambda u: u)
     assert isinstance(cond, torch.nn.Module)
     assert cond.name == 'deepritzcondition'
-    assert cond.module == module
-    assert cond.sampler == ps
+    assert cond.module is helper_module
+    assert cond.sampler is ps
     assert isinstance(cond.residual_fn, UserFunction)
 
 
-def test_ritzcondition_forward():
-    module = UserFunction(helper_fn)
-    ps = GridSampler(Interval(R1('x'), 0, 1), n_points=25)
-    cond = DeepRitzCondition(module=module, sampler=ps,
+def test_ritzcondition_forward(x_interval, helper_module):
+    ps = GridSampler(x_interval, n_points=25)
+    cond = DeepRitzCondition(module=helper_module, sampler=ps,
                              integrand_fn=lambda u: torch.sum(u, dim=1))
     out = cond()
     assert isinstance(out, torch.Tensor)
     assert out.requires_grad
     assert torch.isclose(out, torch.tensor(0.3269), atol=0.0002)
 
-def test_create_adaptiveweightscondition():
-    module = UserFunction(helper_fn)
-    ps = GridSampler(Interval(R1('x'), 0, 1), n_points=25).make_static()
-    cond = AdaptiveWeightsCondition(module, ps, lambda u: u)
+def test_create_adaptiveweightscondition(x_interval, helper_module):
+    ps = GridSampler(x_interval, n_points=25).make_static()
+    cond = AdaptiveWeightsCondition(helper_module, ps, lambda u: u)
     out = cond()
     assert isinstance(out, torch.Tensor)
     assert out.requires_grad
 
-def test_ritzcondition_forward_with_data_function():
-    module = UserFunction(helper_fn)
-    ps = GridSampler(Interval(R1('x'), 0, 1), n_points=25)
+def test_ritzcondition_forward_with_data_function(x_interval, helper_module):
+    ps = GridSampler(x_interval, n_points=25)
     data_fn = {'f': lambda x: x}
-    cond = DeepRitzCondition(module=module, sampler=ps,
+    cond = DeepRitzCondition(module=helper_module, sampler=ps,
                              integrand_fn=lambda u, f: torch.sum(u+f, dim=1),
                              data_functions=data_fn)
     out = cond()
@@ -228,7 +246,7 @@ def test_create_parameter_condition():
     param = Parameter(init=2.0, space=R1('D'))
     def penalty(D): return D-3
     cond = ParameterCondition(parameter=param, penalty=penalty, weight=1)
-    assert cond.parameter == param
+    assert cond.parameter is param
     assert isinstance(cond.penalty, UserFunction)
     assert cond.name == 'parametercondition'
     assert not cond.track_gradients
@@ -89,9 +89,9 @@ def test_laplacian_with_grad_input_2():
     output = f(inp)
     jacobi = jac(output, inp)
     assert jacobi.shape == (4, 2, 3)
-    l_1 = laplacian(output, x, grad=jacobi[:, 0, :2])
-    l_2 = laplacian(output[:, :1], x)
-    assert torch.equal(l_1, l_2)
+    l = laplacian(output, x, grad=jacobi[:, 0, :2])
+    # first output is x_1**2 + x_2 + t**2, so the laplacian w.r.t. x is 2
+    torch.testing.assert_close(l, torch.full((4, 1), 2.0))
 
 
 def test_laplacian_for_complexer_function_1():
@@ -225,7 +225,7 @@ def test_gradient_for_one_input():
     g = grad(output, a)
     assert g.shape[0] == 1
     assert g.shape[1] == 2
-    assert np.equal(g.detach().numpy(), [2, 2]).all()
+    assert np.array_equal(g.detach().numpy(), [[2, 2]])
 
 
 def test_gradient_many_inputs():
@@ -236,7 +236,7 @@ def test_gradient_many_inputs():
     g = grad(output.unsqueeze(-1), a)
     assert g.shape[0] == 3
     assert g.shape[1] == 2
-    assert np.equal(g.detach().numpy(), [[2, 2], [4, 0], [6, 2]]).all()   
+    assert np.array_equal(g.detach().numpy(), [[2, 2], [4, 0], [6, 2]])
 
 
 def test_gradient_1D():
@@ -247,7 +247,7 @@ def test_gradient_1D():
     g = grad(output.unsqueeze(-1), a)
     assert g.shape[0] == 3
     assert g.shape[1] == 1
-    assert np.equal(g.detach().numpy(), [[2], [4], [0]]).all()
+    assert np.array_equal(g.detach().numpy(), [[2], [4], [0]])
 
 
 def test_gradient_3D():
@@ -258,7 +258,7 @@ def test_gradient_3D():
     g = grad(output.unsqueeze(-1), a)
     assert g.shape[0] == 2
     assert g.shape[1] == 3
-    assert np.equal(g.detach().numpy(), [[2, 10, 4], [4, 4, 4]]).all()
+    assert np.array_equal(g.detach().numpy(), [[2, 10, 4], [4, 4, 4]])
 
 
 def test_gradient_mixed_input():
@@ -272,11 +272,11 @@ def test_gradient_mixed_input():
     g = grad(output.unsqueeze(-1), a)
     assert g.shape[0] == a.shape[0]
     assert g.shape[1] == 2
-    assert np.equal(g.detach().numpy(), [[2, 1], [4, 1]]).all()  
+    assert np.array_equal(g.detach().numpy(), [[2, 1], [4, 1]])
     g = grad(output.unsqueeze(-1), b)
     assert g.shape[0] == b.shape[0]
     assert g.shape[1] == 1
-    assert np.equal(g.detach().numpy(), [[3], [3/4]]).all() 
+    assert np.array_equal(g.detach().numpy(), [[3], [3/4]])
 
 
 def test_gradient_for_two_variables_at_the_same_time():
@@ -300,7 +300,7 @@ def test_normal_derivative_for_one_input():
     n = normal_derivative(output.unsqueeze(-1).unsqueeze(0), normal, a)
     assert n.shape[0] == 1
     assert n.shape[1] == 1
-    assert np.equal(n.detach().numpy(), [2]).all()
+    assert np.array_equal(n.detach().numpy(), [[2]])
 
 
 def test_normal_derivative_for_many_inputs():
@@ -439,7 +439,7 @@ def test_jac_one_input():
     d = jac(output, a)
     assert d.shape == (1, 2, 2)
     d = d.detach().numpy()
-    assert np.isclose(d[0], [[2, 1], [0, 2]]).all()
+    assert np.allclose(d[0], [[2, 1], [0, 2]])
 
 
 def test_jac_many_inputs():
@@ -448,9 +448,9 @@ def test_jac_many_inputs():
     d = jac(output, a)
     assert d.shape == (3, 2, 2)
     d = d.detach().numpy()
-    assert np.isclose(d[0], [[2, 1], [0, 2]]).all()
-    assert np.isclose(d[1], [[4, 1], [0, 2]]).all()
-    assert np.isclose(d[2], [[0, 1], [0, 6]]).all()
+    assert np.allclose(d[0], [[2, 1], [0, 2]])
+    assert np.allclose(d[1], [[4, 1], [0, 2]])
+    assert np.allclose(d[2], [[0, 1], [0, 6]])
 
 
 def test_jac_in_3D():
@@ -459,8 +459,8 @@ def test_jac_in_3D():
     d = jac(output, a)
     assert d.shape == (2, 3, 3)
     d = d.detach().numpy()
-    assert np.isclose(d[0], [[2, 1, 0], [0, 2, 0], [0, 0, 0]]).all()
-    assert np.isclose(d[1], [[4, 1, 0], [0, 2, 0], [0, 0, 4]]).all()
+    assert np.allclose(d[0], [[2, 1, 0], [0, 2, 0], [0, 0, 0]])
+    assert np.allclose(d[1], [[4, 1, 0], [0, 2, 0], [0, 0, 4]])
 
 
 def test_jac_for_complexer_function():
@@ -474,8 +474,8 @@ def test_jac_for_complexer_function():
     d = jac(output, a)
     assert d.shape == (2, 3, 3)
     d = d.detach().numpy()
-    assert np.isclose(d[0], [[3,  np.cos(1), 0], [0, 6, 1], [0, 0, 12]]).all()
-    assert np.isclose(d[1], [[12, np.cos(1), 0], [0, 9, 1], [0, 0, 27]]).all()
+    assert np.allclose(d[0], [[3,  np.cos(1), 0], [0, 6, 1], [0, 0, 12]])
+    assert np.allclose(d[1], [[12, np.cos(1), 0], [0, 9, 1], [0, 0, 27]])
 
 
 def test_jac_for_complexer_function_2():
@@ -525,7 +525,7 @@ def test_rot_one_input():
     d = rot(output, a)
     assert d.shape == (1, 3)
     d = d.detach().numpy()
-    assert np.isclose(d[0], [0, 0, -2]).all()
+    assert np.allclose(d[0], [0, 0, -2])
 
 
 def test_rot_many_inputs():
@@ -534,8 +534,7 @@ def test_rot_many_inputs():
     d = rot(output, a)
     assert d.shape == (3, 3)
     d = d.detach().numpy()
-    for i in range(3):
-        assert np.isclose(d[i], [0, 0, -2]).all()
+    assert np.allclose(d, [0, 0, -2])
 
 
 def test_rot_for_complexer_function():
@@ -548,9 +547,9 @@ def test_rot_for_complexer_function():
     d = rot(output, a)
     assert d.shape == (3, 3)
     d = d.detach().numpy()
-    assert np.isclose(d[0], [0, 0, 2]).all()
-    assert np.isclose(d[1], [0, 0, -2]).all()
-    assert np.isclose(d[2], [0, 0, -4]).all()
+    assert np.allclose(d[0], [0, 0, 2])
+    assert np.allclose(d[1], [0, 0, -2])
+    assert np.allclose(d[2], [0, 0, -4])
 
 
 def test_rot_for_complexer_function_2():
@@ -565,8 +564,8 @@ def test_rot_for_complexer_function_2():
     d = rot(output, a)
     assert d.shape == (2, 3)
     d = d.detach().numpy()
-    assert np.isclose(d[0], [1, np.cos(2)-1, 2-2*np.cos(2)]).all()
-    assert np.isclose(d[1], [1, np.cos(0)-1, -2]).all()
+    assert np.allclose(d[0], [1, np.cos(2)-1, 2-2*np.cos(2)])
+    assert np.allclose(d[1], [1, np.cos(0)-1, -2])
 
 
 def test_rot_for_two_variables_at_the_same_time():
@@ -582,8 +581,8 @@ def test_rot_for_two_variables_at_the_same_time():
     d = rot(output, a, b)
     assert d.shape == (2, 3)
     d = d.detach().numpy()
-    assert np.isclose(d[0], [1, np.cos(2)-1, 2-2*np.cos(2)]).all()
-    assert np.isclose(d[1], [1, np.cos(0)-1, -2]).all()
+    assert np.allclose(d[0], [1, np.cos(2)-1, 2-2*np.cos(2)])
+    assert np.allclose(d[1], [1, np.cos(0)-1, -2])
 
 
 # Test partial
@@ -674,7 +673,7 @@ def test_convective_one_input():
     d = convective(output, output, a)
     assert d.shape == (1, 3)
     d = d.detach().numpy()
-    assert np.isclose(d[0], [2, 1, 4]).all()
+    assert np.allclose(d[0], [2, 1, 4])
 
 
 def test_convective_many_inputs():
@@ -683,9 +682,9 @@ def test_convective_many_inputs():
     d = convective(output, output, a)
     assert d.shape == (3, 3)
     d = d.detach().numpy()
-    assert np.isclose(d[0], [2, 1, 4]).all()
-    assert np.isclose(d[1], [0, 0, 0]).all()
-    assert np.isclose(d[2], [2, 1, 40]).all()
+    assert np.allclose(d[0], [2, 1, 4])
+    assert np.allclose(d[1], [0, 0, 0])
+    assert np.allclose(d[2], [2, 1, 40])
 
 
 def test_convective_for_different_conv_field():
@@ -694,9 +693,9 @@ def test_convective_for_different_conv_field():
     d = convective(output, a, a)
     assert d.shape == (3, 3)
     d = d.detach().numpy()
-    assert np.isclose(d[0], [2, 1, 4]).all()
-    assert np.isclose(d[1], [0, 0, 0]).all()
-    assert np.isclose(d[2], [2, 1, 24]).all()
+    assert np.allclose(d[0], [2, 1, 4])
+    assert np.allclose(d[1], [0, 0, 0])
+    assert np.allclose(d[2], [2, 1, 24])
 
 
 def test_convective_in_2D():
@@ -710,8 +709,8 @@ def test_convective_in_2D():
     d = convective(output, a, a)
     assert d.shape == (2, 2)
     d = d.detach().numpy()
-    assert np.isclose(d[0], [2, 1]).all()
-    assert np.isclose(d[1], [0, 1]).all()
+    assert np.allclose(d[0], [2, 1])
+    assert np.allclose(d[1], [0, 1])
 
 
 def test_convective_in_for_two_variables_at_the_same_time():
@@ -726,8 +725,8 @@ def test_convective_in_for_two_variables_at_the_same_time():
     d = convective(output, torch.cat((a, b), dim=1), a, b)
     assert d.shape == (2, 2)
     d = d.detach().numpy()
-    assert np.isclose(d[0], [2, 1]).all()
-    assert np.isclose(d[1], [0, 1]).all()
+    assert np.allclose(d[0], [2, 1])
+    assert np.allclose(d[1], [0, 1])
 
 
 def test_sym_grad():
@@ -28,4 +28,23 @@ def test_get_min_and_max_of_derivative():
     test_min, test_max = compute_min_and_max(model_fun, sampler, eval_fun,
                                              requieres_grad=True)
     assert torch.isclose(test_min, torch.tensor(0.0), atol=0.05)
-    assert torch.isclose(test_max, torch.tensor(2.0), atol=0.05)
\ No newline at end of file
+    assert torch.isclose(test_max, torch.tensor(2.0), atol=0.05)
+
+
+def test_get_min_and_max_does_not_track_gradients():
+    def eval_fun(x):
+        assert torch.is_inference_mode_enabled()
+        return Points(x.as_tensor[:, :1], R1('u'))
+    sampler = GridSampler(Interval(R1('x'), 0, 1), n_points=10)
+    test_min, test_max = compute_min_and_max(eval_fun, sampler)
+    assert not test_max.requires_grad
+
+
+def test_get_min_and_max_does_not_change_sampled_points():
+    def model_fun(x):
+        return Points(x.as_tensor**2, R1('u'))
+    def eval_fun(u, x):
+        return grad(u, x)
+    sampler = GridSampler(Interval(R1('x'), 0, 1), n_points=10).make_static()
+    compute_min_and_max(model_fun, sampler, eval_fun, requieres_grad=True)
+    assert not sampler.sample_points().requires_grad
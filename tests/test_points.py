@@ -222,7 +222,7 @@ def test_divide_points():
     p1 = Points(torch.tensor([[2], [1.0]]), R1('x'))
     p = p1 / p1
     assert isinstance(p, Points)
-    assert torch.equal(torch.tensor([[1.0], [1.0]]), p.as_tensor)
+    torch.testing.assert_close(p.as_tensor, torch.tensor([[1.0], [1.0]]))
 
 
 def test_cant_divide_points_of_different_spaces():
@@ -236,7 +236,7 @@ def test_raise_power_points():
     p1 = Points(torch.tensor([[2], [1.0]]), R1('x'))
     p = p1**p1
     assert isinstance(p, Points)
-    assert torch.equal(torch.tensor([[4.0], [1.0]]), p.as_tensor)
+    torch.testing.assert_close(p.as_tensor, torch.tensor([[4.0], [1.0]]))
 
 
 def test_cant_raise_power_points_of_different_spaces():
@@ -337,4 +337,30 @@ def test_unsqueeze():
     assert torch.allclose(p.unsqueeze(0)._t, tensor_0)
     tensor_1 = torch.tensor([[[1., 0.]], [[2., 4.]], [[9., 4.]]]) 
     assert torch.allclose(p.unsqueeze(1)._t, tensor_1)
-    assert torch.allclose(p.unsqueeze(-1)._t, tensor_1)
\ No newline at end of file
+    assert torch.allclose(p.unsqueeze(-1)._t, tensor_1)
+
+
+def test_track_coord_gradients():
+    p = Points(torch.tensor([[1, 0.0], [2, 4.0], [9, 4]]), R1('x')*R1('t'))
+    coords, p_grad = p.track_coord_gradients()
+    assert coords['x'].requires_grad
+    assert coords['t'].requires_grad
+    assert p_grad.space == p.space
+    assert torch.equal(p_grad._t, p._t)
+    grad_x = torch.autograd.grad(p_grad._t.sum(), coords['x'])[0]
+    assert torch.equal(grad_x, torch.ones((3, 1)))
+
+
+def test_track_coord_gradients_single_variable():
+    p = Points(torch.tensor([[1, 0.0], [2, 4.0], [9, 4]]), R2('x'))
+    coords, p_grad = p.track_coord_gradients()
+    assert coords['x'].requires_grad
+    assert not p.requires_grad
+    grad_x = torch.autograd.grad(p_grad._t.sum(), coords['x'])[0]
+    assert torch.equal(grad_x, torch.ones((3, 2)))
+
+
+def test_track_coord_gradients_empty_points():
+    coords, p_grad = Points.empty().track_coord_gradients()
+    assert coords == {}
+    assert p_grad.isempty
@@ -128,10 +128,8 @@ def test_interval_grid_sampling_with_n():
     points = I.sample_grid(n=10)
     assert points.as_tensor.shape == (10, 1)
     assert all(I._contains(points))
-    for i in range(8):
-        dist_1 = torch.linalg.norm(points.as_tensor[i+1] - points.as_tensor[i])
-        dist_2 = torch.linalg.norm(points.as_tensor[i+1] - points.as_tensor[i+2])
-        assert torch.isclose(dist_1, dist_2)
+    dist = torch.diff(points.as_tensor, dim=0).abs()
+    assert torch.allclose(dist[:-1], dist[1:])
 
 
 def test_interval_grid_sampling_with_n_and_variable_bounds():
@@ -203,10 +201,7 @@ def test_interval_boundary_grid_sampling_with_n():
     points = I.sample_grid(n=10)
     assert points.as_tensor.shape == (10, 1)
     assert all(I._contains(points))
-    for i in range(10):
-        point_eq_0 = points.as_tensor[i] == 0
-        point_eq_1 = points.as_tensor[i] == 1
-        assert point_eq_0 or point_eq_1 
+    assert torch.all((points.as_tensor == 0) | (points.as_tensor == 1))
 
 
 def test_interval_boundary_random_sampling_with_n_and_variable_bounds():
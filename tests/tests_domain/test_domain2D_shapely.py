@@ -202,12 +202,9 @@ def test_boundary_normal_for_concav_poly2D():
     points = torch.tensor([[0, -5], [5, -10], [5, 10], [-10, 7], [-4, 0], [10, 0]])
     points = Points(points, R2('x'))
     normals = P.boundary.normal(points)
-    assert torch.allclose(normals[0], torch.tensor([-1.0, 0]))
-    assert torch.allclose(normals[1], torch.tensor([0.0, -1]))
-    assert torch.allclose(normals[2], torch.tensor([0.0, 1]))
-    assert torch.allclose(normals[3], torch.tensor([-1.0, 0]))
-    assert torch.allclose(normals[4], torch.tensor([0.0, -1]))
-    assert torch.allclose(normals[5], torch.tensor([1.0, 0]))
+    expected_normals = torch.tensor([[-1.0, 0], [0, -1], [0, 1],
+                                     [-1, 0], [0, -1], [1, 0]])
+    assert torch.allclose(normals, expected_normals)
 
 
 def test_boundary_normal_poly2D():
@@ -230,6 +227,4 @@ def test_boundary_normal_poly2D_with_hole():
     points = Points(points, R2('x'))
     normals = P.boundary.normal(points)
     assert normals.shape == (3, 2)
-    assert torch.allclose(normals[0], torch.tensor([0.0, -1]))
-    assert torch.allclose(normals[1], torch.tensor([-1.0, 0]))
-    assert torch.allclose(normals[2], torch.tensor([0.0, 1]))
\ No newline at end of file
+    assert torch.allclose(normals, torch.tensor([[0.0, -1], [-1, 0], [0, 1]]))
\ No newline at end of file
@@ -133,6 +133,19 @@ def test_grid_sampling_inside_poly3D():
                                 poly3D.boundary._contains(points)))    
 
 
+def test_point_grid_in_bounding_box_poly3D():
+    vertices, faces = _create_simple_polygon()
+    poly3D = TrimeshPolyhedron(R3('x'), vertices=vertices, faces=faces)
+    bounds = torch.tensor([0.0, 1.0, 0.0, 2.0, -1.0, 1.0])
+    points = poly3D._point_grid_in_bounding_box(20, bounds, 'cpu')
+    scaled_n = round(len(points)**(1/3))
+    assert len(points) == scaled_n**3
+    assert len(torch.unique(points, dim=0)) == len(points)
+    for i in range(3):
+        axis = torch.linspace(bounds[2*i], bounds[2*i+1], scaled_n)
+        assert torch.allclose(torch.unique(points[:, i]), axis)
+
+
 def test_grid_sampling_inside_poly3D_with_d():
     vertices, faces = _create_simple_polygon()
     poly3D = TrimeshPolyhedron(R3('x'), vertices=vertices, faces=faces)
@@ -202,8 +215,8 @@ def test_normals_poly3D():
     points = poly3D.boundary.sample_grid(n=15)
     normals = poly3D.boundary.normal(points)
     assert normals.shape == (15,3)
-    for i in range(15):
-        assert torch.isclose(torch.linalg.norm(normals[i]), torch.tensor(1.0))
+    assert normals.dtype == torch.float32
+    assert torch.allclose(torch.linalg.norm(normals, dim=1), torch.tensor(1.0))
 
 
 def test_normals_direction_poly3D():
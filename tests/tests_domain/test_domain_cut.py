@@ -117,7 +117,7 @@ def test_bounding_box_of_cut():
     I1 = Interval(R1('x'), 0, 1)
     I2 = Interval(R1('x'), 0.5, 1)
     I = I1 - I2
-    assert all(np.equal(I.bounding_box(), I1.bounding_box()))
+    assert np.array_equal(I.bounding_box(), I1.bounding_box())
 
 
 def test_sample_random_uniform_in_cut_with_n():
@@ -296,7 +296,7 @@ def test_bounding_box_of_cut_boundary():
     I2 = Interval(R1('x'), 0.5, 1)
     I = I1 - I2
     I = I.boundary
-    assert all(np.equal(I.bounding_box(), I1.bounding_box()))
+    assert np.array_equal(I.bounding_box(), I1.bounding_box())
 
 
 def test_sample_random_uniform_in_cut_boundary_with_n():
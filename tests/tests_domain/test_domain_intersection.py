@@ -185,9 +185,9 @@ def test_intersection_boundary_contains_domain_constant_in_2D():
     C2 = Circle(R2('x'), [0, 0], 2)
     C = C1 & C2 
     C = C.boundary 
-    points = Points(torch.FloatTensor([[0.0, 0.0], [0, 1], [0, 2],
+    points = Points(torch.tensor([[0.0, 0.0], [0, 1], [0, 2],
                                   [2.0, 0], [2*np.cos(0.2), 2*np.sin(0.2)],
-                                  [0, -2], [2, 2.0]]), R2('x'))
+                                  [0, -2], [2, 2.0]], dtype=torch.float32), R2('x'))
     inside = C._contains(points)
     assert not any(inside[5:])
     assert all(inside[:5])
@@ -198,11 +198,11 @@ def test_intersection_boundary_contains_domain_changes_in_2D():
     C2 = Circle(R2('x'), [0, 0], lambda t: t+1)
     C = C1 & C2  
     C = C.boundary 
-    points = Points(torch.FloatTensor([[0.0, 0.0], [0, 1], [0, 2],
-                                       [2.0, 0], [2*np.cos(0.2), 2*np.sin(0.2)],
-                                       [0, -2], [2, 2.0], [0, 0], [1, 0], 
-                                       [0.5, 0], [np.cos(0.4), np.sin(0.4)], [0, 0.2],
-                                       [-1, 0], [1.8, 0]]), R2('x'))
+    points = Points(torch.tensor([[0.0, 0.0], [0, 1], [0, 2],
+                                  [2.0, 0], [2*np.cos(0.2), 2*np.sin(0.2)],
+                                  [0, -2], [2, 2.0], [0, 0], [1, 0],
+                                  [0.5, 0], [np.cos(0.4), np.sin(0.4)], [0, 0.2],
+                                  [-1, 0], [1.8, 0]], dtype=torch.float32), R2('x'))
     time = Points(torch.tensor([[1.0], [0.0]]).repeat_interleave(7, dim=0), R1('t'))
     inside = C._contains(points, time)
     assert not any(inside[5:7])
@@ -262,7 +262,7 @@ def test_bounding_box_of_intersection_boundary():
     I2 = Interval(R1('x'), 0.5, 1)
     I = I1 & I2
     I = I.boundary
-    assert all(np.equal(I.bounding_box(), [0.5, 1.0]))
+    assert np.array_equal(I.bounding_box(), [0.5, 1.0])
 
 
 def test_sample_random_uniform_in_intersection_boundary_with_n():
@@ -127,7 +127,7 @@ def test_bounding_box_of_union():
     I1 = Interval(R1('x'), 0, 1)
     I2 = Interval(R1('x'), 0.5, 2)
     I = I1 + I2
-    assert all(np.equal(I.bounding_box(), [0.0, 2.0]))
+    assert np.array_equal(I.bounding_box(), [0.0, 2.0])
 
 
 def test_sample_random_uniform_in_union_with_n():
@@ -271,7 +271,7 @@ def test_bounding_box_of_union_boundary():
     I2 = Interval(R1('x'), 0.5, 1)
     I = I1 + I2
     I = I.boundary
-    assert all(np.equal(I.bounding_box(), I1.bounding_box()))
+    assert np.array_equal(I.bounding_box(), I1.bounding_box())
 
 
 def test_sample_random_uniform_in_union_boundary_with_n():
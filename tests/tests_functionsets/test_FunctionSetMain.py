@@ -58,8 +58,20 @@ def test_create_meshgrid():
     # check correct shape and distribution
     tensor = meshgrid.as_tensor
     assert tensor.shape == (50, 10, 2)
-    for i in range(1, 10):
-        assert tensor[0, 0, 0] == tensor[0, i, 0]
+    assert torch.all(tensor[0, 1:, 0] == tensor[0, 0, 0])
+
+
+def test_create_meshgrid_keeps_gradients_of_points():
+    fn_space, I_k = create_inputs()
+    fn_set = FunctionSet(fn_space, GridSampler(I_k, 5))
+    fn_set.sample_params()
+    points = GridSampler(fn_space.input_domain, 10).sample_points()
+    points.requires_grad = True
+    meshgrid = fn_set._create_meshgrid(points)
+    assert torch.equal(meshgrid.as_tensor[2, :, 1:], points.as_tensor)
+    assert torch.equal(meshgrid.as_tensor[:, 3, :1], fn_set.param_batch.as_tensor)
+    grad, = torch.autograd.grad(meshgrid.as_tensor.sum(), points.as_tensor)
+    assert torch.equal(grad, 5*torch.ones_like(grad))
 
 
 def test_add_functions_sets():
@@ -48,7 +48,7 @@ def test_relu_n_backward():
     in_p = torch.tensor([1.0, 2, -6, 4, -2], requires_grad=True)
     out = relun(in_p)
     deriv, = torch.autograd.grad(torch.sum(out), in_p)
-    assert torch.equal(deriv, torch.tensor([2.0, 4.0, 0, 8, 0]))
+    torch.testing.assert_close(deriv, torch.tensor([2.0, 4.0, 0, 8, 0]))
 
 
 def test_relu_n_backward_2():
@@ -56,7 +56,7 @@ def test_relu_n_backward_2():
     in_p = torch.tensor([1.0, 2, -6, -0.1, -2], requires_grad=True)
     out = relun(in_p)
     deriv, = torch.autograd.grad(torch.sum(out), in_p)
-    assert torch.equal(deriv, torch.tensor([3.0, 12.0, 0, 0, 0]))
+    torch.testing.assert_close(deriv, torch.tensor([3.0, 12.0, 0, 0, 0]))
 
 
 def test_sinus_forward():
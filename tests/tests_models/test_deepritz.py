@@ -1,7 +1,10 @@
+import copy
+import pickle
+
 import torch
 
 from torchphysics.models.deepritz import DeepRitzNet
-from torchphysics.problem.spaces import Points, R1, R2
+from torchphysics.problem.spaces import Points, Space, R1, R2
 
 
 def test_create_deepritz_model():
@@ -29,4 +32,35 @@ def test_forward():
     test_data = Points(torch.tensor([[2, 3.0], [0, 1]]), R2('x'))
     out = net(test_data)
     assert isinstance(out, Points)
-    assert out._t.size() == torch.Size([2, 2])
\ No newline at end of file
+    assert out._t.size() == torch.Size([2, 2])
+
+
+def test_default_activation_is_cubed_relu():
+    net = DeepRitzNet(input_space=R2('x'), output_space=R1('u'),
+                      width=15, depth=3)
+    test_data = torch.linspace(-2, 2, 9)
+    assert torch.allclose(net.activations(test_data),
+                          torch.relu(test_data**3))
+
+
+def test_deepritz_can_be_copied_and_pickled():
+    # R1/R2 can not be copied, so the spaces are created directly
+    net = DeepRitzNet(input_space=Space({'x': 2}), output_space=Space({'u': 1}),
+                      width=15, depth=3)
+    test_data = torch.tensor([[2, 3.0], [0, 1]])
+    net_copy = copy.deepcopy(net)
+    net_pickled = pickle.loads(pickle.dumps(net))
+    assert torch.allclose(net_copy.forward_tensor(test_data),
+                          net.forward_tensor(test_data))
+    assert torch.allclose(net_pickled.forward_tensor(test_data),
+                          net.forward_tensor(test_data))
+
+
+def test_forward_with_different_activation():
+    net = DeepRitzNet(input_space=R2('x'), output_space=R1('u'),
+                      width=15, depth=3, activations=torch.nn.Tanh())
+    assert isinstance(net.activations, torch.nn.Tanh)
+    test_data = Points(torch.tensor([[2, 3.0], [0, 1]]), R2('x'))
+    out = net(test_data)
+    assert isinstance(out, Points)
+    assert out._t.size() == torch.Size([2, 1])
@@ -1,7 +1,17 @@
+import copy
+import pickle
+
+import pytest
 import torch
+import numpy as np
 
 from torchphysics.models.fcn import FCN
-from torchphysics.problem.spaces import Points, R1, R2
+from torchphysics.models.activation_fn import ReLUn
+from torchphysics.problem.spaces import Points, Space, R1, R2
+
+
+# shared input batch, only read by the tests
+_INPUT_DATA = torch.tensor([[2, 3.0], [0, 1]])
 
 
 def test_create_fcn():
@@ -60,7 +70,226 @@ def test_create_fcn_with_different_gains():
 def test_fcn_forward():
     fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
               hidden=(10, 10, 10))
-    test_data = Points(torch.tensor([[2, 3.0], [0, 1]]), R2('x'))
+    test_data = Points(_INPUT_DATA, R2('x'))
+    out = fcn(test_data)
+    assert isinstance(out, Points)
+    assert len(out) == 2
+
+def test_fcn_forward_tensor():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10, 10))
+    out = fcn.forward_tensor(_INPUT_DATA)
+    assert isinstance(out, torch.Tensor)
+    assert torch.equal(out, fcn(Points(_INPUT_DATA, R2('x'))).as_tensor)
+
+
+def test_fcn_to_inference():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10, 10))
+    frozen_fcn = fcn.to_inference()
+    assert isinstance(frozen_fcn, torch.jit.ScriptModule)
+    assert fcn.training
+    assert torch.allclose(frozen_fcn(_INPUT_DATA), fcn.forward_tensor(_INPUT_DATA))
+
+
+def test_fcn_forward_with_mixed_precision():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10, 10), mixed_precision=True)
+    test_data = Points(_INPUT_DATA, R2('x'))
     out = fcn(test_data)
     assert isinstance(out, Points)
-    assert len(out) == 2
\ No newline at end of file
+    assert out.as_tensor.dtype == torch.float32
+    assert fcn.sequential[0].weight.dtype == torch.float32
+
+
+@pytest.mark.slow
+def test_fcn_forward_with_compile():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10), compile=True)
+    assert isinstance(fcn.sequential, torch.nn.Sequential)
+    assert len(fcn.state_dict()) == 6
+    with torch.no_grad():
+        out = fcn.forward_tensor(_INPUT_DATA)
+    assert torch.allclose(out, fcn.sequential(_INPUT_DATA))
+
+
+def test_fcn_with_compile_can_be_copied_and_pickled():
+    # R1 and R2 can not be deep-copied, therefore plain spaces are used
+    fcn = FCN(input_space=Space({'x': 2}), output_space=Space({'u': 1}),
+              hidden=(10, 10), compile=True)
+    fcn._compiled_layers()
+    copied_fcn = copy.deepcopy(fcn)
+    assert copied_fcn.optimized_mode == 'compile'
+    assert copied_fcn._compiled_sequential is None
+    assert fcn._compiled_sequential is not None
+    loaded_fcn = pickle.loads(pickle.dumps(fcn))
+    assert torch.equal(loaded_fcn.sequential[0].weight, fcn.sequential[0].weight)
+
+
+def test_fcn_forward_in_inference_mode():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10))
+    test_data = torch.tensor([[2, 3.0], [0, 1], [1, 1]])
+    with torch.inference_mode():
+        out = fcn.forward_tensor(test_data)
+        buffer = fcn._hidden_buffer
+        out_2 = fcn.forward_tensor(2*test_data)
+    assert buffer.shape == (3, 10)
+    assert fcn._hidden_buffer is buffer
+    assert torch.allclose(out, fcn.sequential(test_data))
+    assert torch.allclose(out_2, fcn.sequential(2*test_data))
+
+
+def test_fcn_does_not_keep_large_buffers_in_inference_mode():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10))
+    test_data = torch.rand((10000, 2))
+    with torch.inference_mode():
+        fcn.forward_tensor(test_data[:3])
+        out = fcn.forward_tensor(test_data)
+    assert fcn._hidden_buffer is None
+    assert torch.allclose(out, fcn.sequential(test_data))
+
+
+def test_fcn_to_inference_with_more_batch_dimensions():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10, 10))
+    frozen_fcn = fcn.to_inference()
+    test_data = torch.tensor([[[2, 3.0], [0, 1]], [[1, 1], [0, 1]]])
+    assert torch.allclose(frozen_fcn(test_data), fcn.forward_tensor(test_data))
+
+
+def test_fcn_regime():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(20, 20, 20))
+    assert fcn.regime(batch_size=10) == 'memory'
+    assert fcn.regime(batch_size=10, machine_balance=1.0) == 'compute'
+
+
+def test_fcn_capture_cuda_graph_needs_cuda_points():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10))
+    test_data = Points(_INPUT_DATA, R2('x'))
+    with pytest.raises(ValueError):
+        fcn.capture_cuda_graph(test_data)
+    with pytest.raises(RuntimeError):
+        fcn.replay_cuda_graph(test_data)
+
+
+def test_fcn_replay_cuda_graph_checks_input():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10))
+    # the input checks happen before the graph is replayed
+    fcn._cuda_graph = (None, torch.zeros((2, 2)), None)
+    with pytest.raises(ValueError):
+        fcn.replay_cuda_graph(Points(torch.tensor([[1.0, 2.0]]), R2('x')))
+    with pytest.raises(ValueError):
+        fcn.replay_cuda_graph(Points(_INPUT_DATA.double(), R2('x')))
+
+
+def test_fcn_with_cuda_graph_can_be_copied_and_pickled():
+    # R1 and R2 can not be deep-copied, therefore plain spaces are used
+    fcn = FCN(input_space=Space({'x': 2}), output_space=Space({'u': 1}),
+              hidden=(10, 10))
+    # like a CUDAGraph, a lambda can not be pickled
+    fcn._cuda_graph = (lambda: None, torch.zeros((2, 2)), torch.zeros((2, 1)))
+    copied_fcn = copy.deepcopy(fcn)
+    assert copied_fcn._cuda_graph is None
+    assert fcn._cuda_graph is not None
+    loaded_fcn = pickle.loads(pickle.dumps(fcn))
+    assert loaded_fcn._cuda_graph is None
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="needs CUDA")
+def test_fcn_replay_cuda_graph():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10)).cuda()
+    test_data = Points(_INPUT_DATA, R2('x')).cuda()
+    fcn.capture_cuda_graph(test_data)
+    new_data = Points(torch.tensor([[1, 3.0], [0, 2]]), R2('x')).cuda()
+    out = fcn.replay_cuda_graph(new_data)
+    assert torch.allclose(out.as_tensor, fcn(new_data).as_tensor)
+
+
+def test_fcn_export_numpy():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10, 10), 
+              activations=(torch.nn.Tanh(), torch.nn.ReLU(), torch.nn.Sigmoid()))
+    numpy_fcn = fcn.export_numpy()
+    out = numpy_fcn(_INPUT_DATA.numpy())
+    assert isinstance(out, np.ndarray)
+    assert np.allclose(out, fcn.forward_tensor(_INPUT_DATA).detach().numpy(), atol=1e-6)
+
+
+def test_fcn_export_numpy_with_unknown_activation():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10), activations=torch.nn.ELU())
+    with pytest.raises(ValueError, match='Tanh'):
+        fcn.export_numpy()
+
+
+def test_fcn_optimize():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10))
+    test_data = Points(_INPUT_DATA, R2('x'))
+    mode, layers = fcn.optimize(test_data, modes=('eager', 'script+freeze'), n=5)
+    assert mode in ('eager', 'script+freeze')
+    assert fcn.optimized_mode == 'eager'
+    with torch.no_grad():
+        assert torch.allclose(layers(_INPUT_DATA), fcn.sequential(_INPUT_DATA),
+                              atol=1e-6)
+
+
+def test_fcn_optimize_keeps_using_current_weights():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10))
+    test_data = Points(_INPUT_DATA, R2('x'))
+    mode, _ = fcn.optimize(test_data, modes=('script+freeze', ), n=2)
+    assert mode == 'script+freeze'
+    with torch.no_grad():
+        fcn.sequential[0].weight.zero_()
+        out = fcn(test_data)
+    assert torch.allclose(out.as_tensor, fcn.sequential(_INPUT_DATA))
+
+
+def test_fcn_optimize_skips_modes_that_can_not_be_created():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10), activations=ReLUn(n=2))
+    test_data = Points(_INPUT_DATA, R2('x'))
+    with pytest.warns(UserWarning, match='script\\+freeze'):
+        mode, layers = fcn.optimize(test_data, modes=('eager', 'script+freeze'),
+                                    n=2)
+    assert mode == 'eager'
+    assert layers == fcn.forward_tensor
+    with pytest.warns(UserWarning):
+        with pytest.raises(RuntimeError) as error:
+            fcn.optimize(test_data, modes=('script+freeze', ), n=2)
+    assert error.value.__cause__ is not None
+
+
+def test_fcn_optimize_measures_forward_tensor():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10), mixed_precision=True)
+    test_data = Points(_INPUT_DATA, R2('x'))
+    mode, layers = fcn.optimize(test_data, modes=('eager', ), n=2)
+    assert mode == 'eager'
+    assert layers == fcn.forward_tensor
+    with torch.no_grad():
+        assert layers(_INPUT_DATA).dtype == _INPUT_DATA.dtype
+
+
+def test_fcn_can_be_pickled_after_optimize():
+    fcn = FCN(input_space=Space({'x': 2}), output_space=Space({'u': 1}),
+              hidden=(10, 10))
+    fcn.optimize(Points(_INPUT_DATA, Space({'x': 2})),
+                 modes=('eager', 'script+freeze'), n=2)
+    loaded_fcn = pickle.loads(pickle.dumps(fcn))
+    assert loaded_fcn.optimized_mode == 'eager'
+
+
+def test_fcn_optimize_with_unknown_mode():
+    fcn = FCN(input_space=R2('x'), output_space=R1('u'), 
+              hidden=(10, 10))
+    test_data = Points(_INPUT_DATA, R2('x'))
+    with pytest.raises(ValueError):
+        fcn.optimize(test_data, modes=('fast', ))
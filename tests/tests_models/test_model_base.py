@@ -22,9 +22,10 @@ def test_create_normalization_layer():
     C = Circle(in_space, [1, 0], 2.0)
     model = NormalizationLayer(C)
     assert isinstance(model, torch.nn.Module)
-    assert torch.equal(model.normalize.bias, torch.tensor([-0.5, 0.0]))
-    assert torch.equal(model.normalize.weight, torch.tensor([[0.5, 0.0],
-                                                             [0.0, 0.5]]))
+    torch.testing.assert_close(model.normalize.bias, torch.tensor([-0.5, 0.0]))
+    torch.testing.assert_close(model.normalize.weight,
+                               torch.tensor([[0.5, 0.0],
+                                             [0.0, 0.5]]))
     assert model.input_space == in_space
     assert model.output_space == in_space
 
@@ -34,10 +35,11 @@ def test_create_normalization_layer_for_product_domain():
     C = Circle(R2('x'), [1, 0], 2.0) * Interval(R1('t'), 0, 1)
     model = NormalizationLayer(C)
     assert isinstance(model, torch.nn.Module)
-    assert torch.equal(model.normalize.bias, torch.tensor([-0.5, 0.0, -1.0]))
-    assert torch.equal(model.normalize.weight, torch.tensor([[0.5, 0.0, 0.0],
-                                                             [0.0, 0.5, 0.0], 
-                                                             [0.0, 0.0, 2.0]]))
+    torch.testing.assert_close(model.normalize.bias, torch.tensor([-0.5, 0.0, -1.0]))
+    torch.testing.assert_close(model.normalize.weight,
+                               torch.tensor([[0.5, 0.0, 0.0],
+                                             [0.0, 0.5, 0.0],
+                                             [0.0, 0.0, 2.0]]))
     assert model.input_space == in_space
     assert model.output_space == in_space
 
@@ -153,4 +155,25 @@ def test_parallel_model_forward_different_input_spaces():
     out = parallel(inp)
     assert isinstance(out, Points)
     assert out.space == R1('u')*R1('v')
-    assert out.as_tensor.shape == (2, 2)
\ No newline at end of file
+    assert out.as_tensor.shape == (2, 2)
+
+def test_sequential_model_forward_tensor():
+    model = Sequential(NormalizationLayer(Circle(R2('x'), [1, 0], 2.0)),
+                       FCN(input_space=R2('x'), output_space=R1('u'), hidden=(10, )))
+    inp = torch.tensor([[0.0, 0.0], [2.0, 2.0], [2.0, 3.0]])
+    out = model.forward_tensor(inp)
+    assert isinstance(out, torch.Tensor)
+    assert torch.equal(out, model(Points(inp, R2('x'))).as_tensor)
+
+
+def test_model_forward_many():
+    fcn = FCN(input_space=R2('x')*R1('t'), output_space=R1('u'), hidden=(10, ))
+    inp_1 = Points(torch.tensor([[0.0, 0.0, 1.0], [2.0, 2.0, 0.0]]), R2('x')*R1('t'))
+    inp_2 = Points(torch.tensor([[1.0, 0.0, 3.0]]), R1('t')*R2('x'))
+    out = fcn.forward_many([inp_1, inp_2])
+    assert len(out) == 2
+    assert out[0].space == R1('u')
+    assert out[0].as_tensor.shape == (2, 1)
+    assert out[1].as_tensor.shape == (1, 1)
+    assert torch.allclose(out[0].as_tensor, fcn(inp_1).as_tensor)
+    assert torch.allclose(out[1].as_tensor, fcn(inp_2).as_tensor)
@@ -1,5 +1,6 @@
 import pytest
 import torch
+import numpy as np
 import matplotlib.pyplot as pyplot
 
 import torchphysics.utils.plotting.plot_functions as plt  
@@ -23,6 +24,22 @@ def test_plot_create_info_text():
     assert text == ''
 
 
+def test_plot_compute_output_shape():
+    assert plt._compute_output_shape(np.zeros((10, 2))) == 2
+    assert plt._compute_output_shape(np.zeros(10)) == 1
+    assert plt._compute_output_shape([[1, 2, 3]]) == 3
+    assert plt._compute_output_shape(4.0) == 1
+
+
+def test_plot_evaluate_model_sorts_input():
+    model = FCN(input_space=R1('t')*R2('x'), output_space=R1('u'))
+    inp_dict = {'x': torch.tensor([[1.0, 2.0], [0.0, 1.0]]),
+                't': torch.tensor([[3.0], [4.0]])}
+    out = plt._evaluate_model(model, inp_dict)
+    expected = model(Points.from_coordinates(inp_dict))
+    assert torch.allclose(out['u'], expected.as_tensor)
+
+
 def test_plot_triangulation_of_domain():
     domain = Parallelogram(R2('x'), [0, 0], [1, 0.0], [0, 1])
     ps = PlotSampler(domain, n_points=200)
@@ -31,8 +48,8 @@ def test_plot_triangulation_of_domain():
     triangulation = plt._triangulation_of_domain(domain, numpy_points) 
     assert len(triangulation.x) == len(numpy_points)
     assert len(triangulation.y) == len(numpy_points)
-    points = torch.column_stack((torch.FloatTensor(triangulation.x),
-                                torch.FloatTensor(triangulation.y)))
+    points = torch.column_stack((torch.as_tensor(triangulation.x, dtype=torch.float32),
+                                 torch.as_tensor(triangulation.y, dtype=torch.float32)))
     points = Points(points, R2('x'))
     assert all(torch.logical_or(domain._contains(points),
                                 domain.boundary._contains(points)))
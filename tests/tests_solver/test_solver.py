@@ -1,9 +1,11 @@
+import pytest
 import torch
 
 import torchphysics as tp
 
 
-def _create_dummy_problem():
+@pytest.fixture
+def dummy_condition():
     fcn = tp.FCN(tp.spaces.R1('x'), tp.spaces.R1('u'))
     ps = tp.samplers.RandomUniformSampler(tp.domains.Interval(tp.spaces.R1('x'), 0, 1), 
                                           n_points=10)
@@ -28,23 +30,21 @@ def test_create_solver():
     assert isinstance(solver.optimizer_setting, tp.OptimizerSetting)
 
 
-def test_config_optimizers():
-    cond = _create_dummy_problem()
+def test_config_optimizers(dummy_condition):
     opi = tp.OptimizerSetting(optimizer_class=torch.optim.Adam, lr=0.1)
-    solver = tp.Solver(train_conditions=[cond], optimizer_setting=opi)
+    solver = tp.Solver(train_conditions=[dummy_condition], optimizer_setting=opi)
     solver_opi = solver.configure_optimizers()
     assert isinstance(solver_opi, torch.optim.Adam)
     for p in solver_opi.param_groups:
         assert p['lr'] == 0.1 
 
 
-def test_config_optimizers_with_lr_scheduler():
-    cond = _create_dummy_problem()
+def test_config_optimizers_with_lr_scheduler(dummy_condition):
     opi = tp.OptimizerSetting(optimizer_class=torch.optim.Adam, lr=0.1, 
                               scheduler_class=torch.optim.lr_scheduler.ExponentialLR, 
                               scheduler_args={'gamma': 3},
                               scheduler_frequency=2)
-    solver = tp.Solver(train_conditions=[cond], optimizer_setting=opi)
+    solver = tp.Solver(train_conditions=[dummy_condition], optimizer_setting=opi)
     solver_opi, scheduler = solver.configure_optimizers()
     assert isinstance(solver_opi[0], torch.optim.Adam)
     for p in solver_opi[0].param_groups: